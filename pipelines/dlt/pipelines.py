@@ -6,38 +6,348 @@ This module contains the main pipeline functions for extracting data from:
 - Bitbucket (pull requests, activities, commits, repositories, branches)
 - Jenkins (jobs, builds, queue snapshots)
 
-All pipelines write to Bronze layer as JSONL files with manifest/cursor tracking.
+All pipelines write to Bronze layer as Parquet files through dlt's filesystem
+destination (Snappy-compressed, dlt's default) and manifest/cursor tracking.
+Loads done outside dlt use resources.writers.ParquetWriter, which writes ZSTD
+Parquet with a JSONL sidecar for rows that do not fit the schema.
 """
 
+import hashlib
+import mmap
 import os
+import pickle
+import stat
 import sys
+import tempfile
 import yaml
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple, get_args, get_origin, get_type_hints
 
-import dlt
-from dlt.common.typing import TDataItem
-from dlt.extract.source import DltSource
+if TYPE_CHECKING:
+    # dlt takes hundreds of ms to import; pipelines import it locally when run
+    import dlt
+    from dlt.common.typing import TDataItem
+    from dlt.extract.source import DltSource
+
+try:
+    # libyaml-backed loader, several times faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
+CONFIG_FILES = ("sources.yaml", "time.yaml")
+CONFIG_CACHE_DIR = Path(os.getenv("DPL_CACHE_DIR", Path.home() / ".cache" / "dpl"))
+CONFIG_CACHE_VERSION = 1
+
+
+# Per-file (resolved path, mtime_ns, size); changes whenever a file is edited
+ConfigStamp = Tuple[Tuple[str, int, int], ...]
+
+
+def _config_stamp() -> ConfigStamp:
+    """Stat each config file so caches can be keyed on its current version."""
+    stamp = []
+    for name in CONFIG_FILES:
+        path = (CONFIG_DIR / name).resolve()
+        st = path.stat()
+        stamp.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+def _config_cache_key(stamp: ConfigStamp) -> str:
+    """Build an on-disk snapshot key from the config stamp."""
+    digest = hashlib.sha1(f"v{CONFIG_CACHE_VERSION}".encode())
+    for path, mtime_ns, size in stamp:
+        digest.update(f"{path}:{mtime_ns}:{size}".encode())
+    return digest.hexdigest()
+
+
+def _config_cache_prefix() -> str:
+    """Per-checkout snapshot name prefix, so checkouts sharing a cache never prune each other."""
+    checkout = hashlib.sha1(str(CONFIG_DIR.resolve()).encode()).hexdigest()[:12]
+    return f"config-{checkout}-"
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Owned by the current user and inaccessible to group/other."""
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def _config_cache_dir() -> Optional[Path]:
+    """
+    Return the snapshot directory, or None if it cannot be trusted.
+    
+    Snapshots are unpickled, so the directory must be a real directory
+    owned by the current user and closed to everyone else.
+    """
+    if not hasattr(os, "getuid"):
+        return None
+    try:
+        CONFIG_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(CONFIG_CACHE_DIR)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid():
+            return None
+        if st.st_mode & 0o077:
+            os.chmod(CONFIG_CACHE_DIR, 0o700)
+    except OSError:
+        return None
+    return CONFIG_CACHE_DIR
+
+
+def _read_config_snapshot(cache_file: Path) -> Optional[Dict[str, Any]]:
+    """Memory-map a cached config snapshot, returning None if unusable."""
+    try:
+        fd = os.open(cache_file, os.O_RDONLY | os.O_NOFOLLOW)
+    except OSError:
+        return None
+    try:
+        # Never unpickle a file someone else could have written
+        if not _is_private(os.fstat(fd)):
+            return None
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            return pickle.loads(mm)
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+        return None
+    finally:
+        os.close(fd)
+
+
+def _write_config_snapshot(cache_file: Path, config: Dict[str, Any]) -> None:
+    """
+    Atomically write a config snapshot and prune superseded ones.
+    
+    Failures only cost a re-parse on the next run.
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return
+    
+    for stale in cache_file.parent.glob(f"{_config_cache_prefix()}*.bin"):
+        if stale != cache_file:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
 
 
 def load_config() -> Dict[str, Any]:
-    """Load configuration from YAML files."""
-    config_dir = Path(__file__).parent.parent.parent / "config"
+    """
+    Load configuration from YAML files.
     
-    with open(config_dir / "sources.yaml", "r") as f:
-        sources_config = yaml.safe_load(f)
+    Repeated calls return the same dict object until either file changes,
+    so callers must treat it as read-only. Across processes the parsed
+    result is snapshotted to ~/.cache/dpl so later CLI runs skip YAML
+    parsing as long as the source files are unchanged.
+    """
+    return _load_config_cached(_config_stamp())
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(stamp: ConfigStamp) -> Dict[str, Any]:
+    cache_dir = _config_cache_dir()
+    cache_file = cache_dir / f"{_config_cache_prefix()}{_config_cache_key(stamp)}.bin" if cache_dir else None
     
-    with open(config_dir / "time.yaml", "r") as f:
-        time_config = yaml.safe_load(f)
+    if cache_file is not None:
+        config = _read_config_snapshot(cache_file)
+        if config is not None:
+            return config
     
-    return {
+    sources_path, time_path = (Path(path) for path, _, _ in stamp)
+    
+    with open(sources_path, "r") as f:
+        sources_config = yaml.load(f, Loader=YamlLoader)
+    
+    with open(time_path, "r") as f:
+        time_config = yaml.load(f, Loader=YamlLoader)
+    
+    config = {
         "sources": sources_config,
         "time": time_config
     }
+    if cache_file is not None:
+        _write_config_snapshot(cache_file, config)
+    return config
+
+
+@dataclass(frozen=True, slots=True)
+class JiraConfig:
+    base_url: str
+    projects: Tuple[str, ...]
+    jql: str
+    expand: Tuple[str, ...]
+    page_size: int
+    lookback_days_first_run: int
+    cursor_field: str
+    rate_limit_per_second: float = field(metadata={"positive": True})
+
+
+@dataclass(frozen=True, slots=True)
+class BitbucketConfig:
+    workspace: str
+    repos: Tuple[str, ...] = field(metadata={"wildcard": "*"})
+    page_size: int
+    pr_states: Tuple[str, ...]
+    lookback_days_first_run: int
+    cursor_field_prs: str
+    cursor_field_commits: str
+    rate_limit_per_second: float = field(metadata={"positive": True})
+
+
+@dataclass(frozen=True, slots=True)
+class JenkinsConfig:
+    base_url: str
+    jobs_include: Tuple[str, ...]
+    include_changesets: bool
+    lookback_days_first_run: int
+    cursor_field: str
+    rate_limit_per_second: float = field(metadata={"positive": True})
 
 
-def jira_pipeline() -> DltSource:
+@dataclass(frozen=True, slots=True)
+class RetryConfig:
+    max_attempts: int
+    base_delay_seconds: float
+    max_delay_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class CommonConfig:
+    concurrency: int
+    retry: RetryConfig
+    output_dir: str
+    loader_file_format: str
+    safety_window_hours: int
+
+
+@dataclass(frozen=True, slots=True)
+class SourcesConfig:
+    jira: JiraConfig
+    bitbucket: BitbucketConfig
+    jenkins: JenkinsConfig
+    common: CommonConfig
+
+
+@dataclass(frozen=True, slots=True)
+class WindowsConfig:
+    jira_sync: str
+    bitbucket_sync: str
+    jenkins_sync: str
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleConfig:
+    preferred_sync_hour: int
+    max_runtime_hours: int
+
+
+@dataclass(frozen=True, slots=True)
+class TimeConfig:
+    timezone: str
+    week_ends: str
+    windows: WindowsConfig
+    schedule: ScheduleConfig
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    sources: SourcesConfig
+    time: TimeConfig
+
+
+def _build_config(cls, data: Any, path: str):
+    """Recursively build and validate a frozen config dataclass from YAML data."""
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a mapping, got {type(data).__name__}")
+    
+    hints = get_type_hints(cls)
+    unknown = set(data) - {f.name for f in fields(cls)}
+    if unknown:
+        raise ValueError(f"{path}: unknown keys {sorted(unknown)}")
+    
+    values = {}
+    for f in fields(cls):
+        name = f.name
+        if name not in data:
+            raise ValueError(f"{path}.{name}: missing")
+        value = data[name]
+        if "wildcard" in f.metadata and value == f.metadata["wildcard"]:
+            # A bare "*" (e.g. repos: "*") stands for the one-item list
+            value = [value]
+        values[name] = _coerce_value(hints[name], value, f"{path}.{name}")
+        if f.metadata.get("positive") and values[name] <= 0:
+            raise ValueError(f"{path}.{name}: must be > 0, got {values[name]}")
+    return cls(**values)
+
+
+def _coerce_value(hint: Any, value: Any, path: str) -> Any:
+    """Validate a single config value against its annotation."""
+    if is_dataclass(hint):
+        return _build_config(hint, value, path)
+    if get_origin(hint) is tuple:
+        if not isinstance(value, list):
+            raise ValueError(f"{path}: expected a list, got {type(value).__name__}")
+        item_type = get_args(hint)[0]
+        return tuple(_coerce_value(item_type, item, f"{path}[{i}]") for i, item in enumerate(value))
+    if hint is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if (hint is int and isinstance(value, bool)) or not isinstance(value, hint):
+        raise ValueError(f"{path}: expected {hint.__name__}, got {type(value).__name__}")
+    return value
+
+
+def get_config() -> Config:
+    """
+    Return the validated, immutable configuration.
+    
+    Rebuilt only when a config file changes; pipelines should read
+    e.g. cfg.sources.jira.page_size rather than indexing raw dicts.
+    """
+    return _get_config_cached(_config_stamp())
+
+
+@lru_cache(maxsize=4)
+def _get_config_cached(stamp: ConfigStamp) -> Config:
+    return _build_config(Config, _load_config_cached(stamp), "config")
+
+
+# Relative to <output_dir>/<source>/: one directory per stream, partitioned
+# by collection date, i.e. bronze/{source}/{stream}/YYYY/MM/DD/*.parquet
+BRONZE_LAYOUT = "{table_name}/{YYYY}/{MM}/{DD}/{load_id}.{file_id}.{ext}"
+
+
+def _run_to_bronze(source: "DltSource", source_name: str) -> Any:
+    """Load a source into the Bronze directory in the configured file format."""
+    import dlt
+    
+    common = get_config().sources.common
+    pipeline = dlt.pipeline(
+        pipeline_name=source_name,
+        destination=dlt.destinations.filesystem(
+            bucket_url=common.output_dir,
+            layout=BRONZE_LAYOUT,
+        ),
+        dataset_name=source_name,
+    )
+    return pipeline.run(source, loader_file_format=common.loader_file_format)
+
+
+def jira_pipeline() -> "DltSource":
     """
     Jira data extraction pipeline.
     
@@ -54,7 +364,7 @@ def jira_pipeline() -> DltSource:
     raise NotImplementedError("Jira pipeline will be implemented in Unit 3")
 
 
-def bitbucket_pipeline() -> DltSource:
+def bitbucket_pipeline() -> "DltSource":
     """
     Bitbucket data extraction pipeline.
     
@@ -69,7 +379,7 @@ def bitbucket_pipeline() -> DltSource:
     raise NotImplementedError("Bitbucket pipeline will be implemented in Unit 4")
 
 
-def jenkins_pipeline() -> DltSource:
+def jenkins_pipeline() -> "DltSource":
     """
     Jenkins data extraction pipeline.
     
@@ -86,6 +396,10 @@ def backfill_pipeline(days: int = 120) -> None:
     """
     Backfill pipeline - resets cursors and re-extracts historical data.
     
+    Each source/stream cursor is reset to `now - days` (see
+    resources.cursors.backfill_cursor) and extraction streams forward
+    from there using keyset pagination, never OFFSET.
+    
     Args:
         days: Number of days to backfill
     """
@@ -93,27 +407,32 @@ def backfill_pipeline(days: int = 120) -> None:
     raise NotImplementedError("Backfill pipeline will be implemented in Unit 2")
 
 
+def _run_backfill(args: List[str]) -> str:
+    days = int(args[0]) if args else 120
+    backfill_pipeline(days)
+    return f"Backfill completed for {days} days"
+
+
+# CLI handlers: each takes the remaining argv and returns a status line
+_DISPATCH: Dict[str, Callable[[List[str]], str]] = {
+    "jira": lambda args: f"Jira pipeline loaded: {_run_to_bronze(jira_pipeline(), 'jira')}",
+    "bitbucket": lambda args: f"Bitbucket pipeline loaded: {_run_to_bronze(bitbucket_pipeline(), 'bitbucket')}",
+    "jenkins": lambda args: f"Jenkins pipeline loaded: {_run_to_bronze(jenkins_pipeline(), 'jenkins')}",
+    "backfill": _run_backfill,
+}
+
+
 if __name__ == "__main__":
     # CLI entrypoint for individual pipeline testing
     if len(sys.argv) < 2:
-        print("Usage: python pipelines.py [jira|bitbucket|jenkins|backfill] [args...]")
+        print(f"Usage: python pipelines.py [{'|'.join(_DISPATCH)}] [args...]")
         sys.exit(1)
     
     pipeline_name = sys.argv[1]
+    handler = _DISPATCH.get(pipeline_name)
     
-    if pipeline_name == "jira":
-        source = jira_pipeline()
-        print(f"Jira pipeline created: {source}")
-    elif pipeline_name == "bitbucket":
-        source = bitbucket_pipeline()
-        print(f"Bitbucket pipeline created: {source}")
-    elif pipeline_name == "jenkins":
-        source = jenkins_pipeline()
-        print(f"Jenkins pipeline created: {source}")
-    elif pipeline_name == "backfill":
-        days = int(sys.argv[2]) if len(sys.argv) > 2 else 120
-        backfill_pipeline(days)
-        print(f"Backfill completed for {days} days")
-    else:
+    if handler is None:
         print(f"Unknown pipeline: {pipeline_name}")
         sys.exit(1)
+    
+    print(handler(sys.argv[2:]))
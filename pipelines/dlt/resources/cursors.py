@@ -0,0 +1,165 @@
+"""
+Keyset cursors for incremental extraction.
+
+Each source/stream keeps a small cursor (last seen id + updated timestamp)
+in the Bronze manifest as {"cursor": {"last_id": ..., "last_updated": ...}}.
+Pages are requested *after* the cursor rather than by offset, so fetching
+a page costs the same regardless of history depth and a resumed run never
+re-scans data it has already landed.
+
+Servers are queried with an inclusive `updated >= last_updated` bound
+(Jira JQL only has minute precision, and neither API can tiebreak on id
+in the same query), and pipelines drop already-landed records with
+Cursor.is_after(). Records sharing the cursor timestamp are delivered at
+least once; none are skipped.
+"""
+
+import re
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional
+from zoneinfo import ZoneInfo
+
+from .endpoints import bitbucket_list_params, jira_search_params
+
+_ORDER_BY = re.compile(r"\s*\bORDER\s+BY\b.*$", re.IGNORECASE | re.DOTALL)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize to an aware UTC datetime; naive values are taken as UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position of the last record landed for a source/stream."""
+
+    last_id: Optional[str] = None
+    last_updated: Optional[datetime] = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "last_updated", _as_utc(self.last_updated))
+
+    def to_manifest(self) -> Dict[str, Any]:
+        """Serialize to the manifest's cursor entry."""
+        return {
+            "cursor": {
+                "last_id": self.last_id,
+                "last_updated": self.last_updated.isoformat() if self.last_updated else None,
+            }
+        }
+
+    @classmethod
+    def from_manifest(cls, entry: Optional[Dict[str, Any]]) -> "Cursor":
+        """Deserialize a manifest entry; a missing entry is an empty cursor."""
+        cursor = (entry or {}).get("cursor") or {}
+        last_updated = cursor.get("last_updated")
+        return cls(
+            last_id=cursor.get("last_id"),
+            last_updated=datetime.fromisoformat(last_updated) if last_updated else None,
+        )
+
+    def is_after(self, record_id: Any, updated: datetime) -> bool:
+        """Whether a record fetched with the inclusive bound still needs landing."""
+        if self.last_updated is None:
+            return True
+        updated = _as_utc(updated)
+        if updated != self.last_updated:
+            return updated > self.last_updated
+        return str(record_id) != self.last_id
+
+    def advance(self, record_id: Any, updated: datetime) -> "Cursor":
+        """Move the cursor forward to a record if it is not older."""
+        updated = _as_utc(updated)
+        if self.last_updated is not None and updated < self.last_updated:
+            return self
+        return replace(self, last_id=str(record_id), last_updated=updated)
+
+
+def backfill_cursor(days: int, now: Optional[datetime] = None) -> Cursor:
+    """Cursor positioned `days` back from now, used to reset for a backfill."""
+    now = _as_utc(now) or datetime.now(timezone.utc)
+    return Cursor(last_updated=now - timedelta(days=days))
+
+
+def with_safety_window(cursor: Cursor, hours: int) -> Cursor:
+    """Rewind the cursor timestamp to re-read records updated in-flight."""
+    if cursor.last_updated is None:
+        return cursor
+    return replace(cursor, last_updated=cursor.last_updated - timedelta(hours=hours))
+
+
+def jira_cursor_params(
+    cursor: Cursor,
+    base_jql: str,
+    tz: str,
+    field: str = "updated",
+    fields: Iterable[str] = ("summary",),
+    max_results: int = 100,
+    next_page_token: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    JQL search params reading forward from the cursor in update order.
+
+    JQL date literals are read in the Jira user's profile timezone, so the
+    cursor is converted to `tz` (time.yaml's timezone) before formatting.
+    Formatting floors to the minute, which only ever widens the bound.
+    The cursor field is always requested so records can be passed to
+    Cursor.is_after() and advance().
+    """
+    clauses = []
+    jql = _ORDER_BY.sub("", base_jql or "").strip()
+    if jql:
+        clauses.append(f"({jql})")
+    if cursor.last_updated is not None:
+        since = cursor.last_updated.astimezone(ZoneInfo(tz)).strftime("%Y/%m/%d %H:%M")
+        clauses.append(f'{field} >= "{since}"')
+    query = " AND ".join(clauses)
+    order = f"ORDER BY {field} ASC"
+
+    fields = dict.fromkeys((*fields, field))
+    params = jira_search_params(f"{query} {order}" if query else order, fields, max_results)
+    if next_page_token:
+        params["nextPageToken"] = next_page_token
+    return params
+
+
+def bitbucket_cursor_params(
+    cursor: Cursor,
+    fields: Iterable[str],
+    field: str = "updated_on",
+    pagelen: int = 50,
+    page: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Bitbucket list params filtering and sorting on the cursor field.
+
+    The sparse fieldset always keeps `values.<field>` for cursoring and
+    `next` for pagination, whatever the caller selects.
+    """
+    fields = dict.fromkeys((*fields, f"values.{field}", "next"))
+    params = bitbucket_list_params(fields, pagelen)
+    params["sort"] = field
+    if cursor.last_updated is not None:
+        params["q"] = f"{field} >= {cursor.last_updated.isoformat()}"
+    if page:
+        params["page"] = page
+    return params
+
+
+def jenkins_builds_tree(
+    start: int,
+    size: int,
+    fields: str = "number,timestamp,result",
+) -> str:
+    """
+    Jenkins tree query for one window of builds.
+
+    Jenkins lists builds newest first, so callers slide the window forward
+    until they reach a build number at or below the cursor's last_id.
+    """
+    return f"builds[{fields}]{{{start},{start + size}}}"
@@ -0,0 +1,45 @@
+"""
+Bulk API endpoints shared by the source pipelines.
+
+Each source is read through its listing/search endpoint with a sparse
+field selection, so one request returns a page of items instead of one
+request per item:
+- Jira: JQL search returning only the requested fields
+- Bitbucket: list endpoints with a `fields` sparse fieldset
+- Jenkins: `/api/json` narrowed with a `tree` query
+"""
+
+from typing import Any, Dict, Iterable
+
+JIRA_MYSELF_PATH = "/rest/api/3/myself"
+JIRA_SEARCH_PATH = "/rest/api/3/search/jql"
+
+BITBUCKET_API_URL = "https://api.bitbucket.org/2.0"
+
+JENKINS_API_PATH = "/api/json"
+
+
+def jira_search_params(
+    jql: str,
+    fields: Iterable[str] = ("summary",),
+    max_results: int = 100,
+) -> Dict[str, Any]:
+    """Query params for a Jira JQL search page."""
+    return {
+        "jql": jql,
+        "fields": ",".join(fields),
+        "maxResults": max_results,
+    }
+
+
+def bitbucket_list_params(fields: Iterable[str], pagelen: int = 50) -> Dict[str, Any]:
+    """Query params for a Bitbucket list endpoint with a sparse fieldset."""
+    return {
+        "fields": ",".join(fields),
+        "pagelen": pagelen,
+    }
+
+
+def jenkins_tree_params(tree: str = "jobs[name]") -> Dict[str, Any]:
+    """Query params selecting a subtree of a Jenkins JSON API response."""
+    return {"tree": tree}
@@ -0,0 +1,251 @@
+"""
+Async HTTP helpers for the source pipelines.
+
+One HTTP/2 httpx.AsyncClient per source multiplexes requests over a small
+pool of keep-alive connections; page requests are fanned out concurrently
+behind a semaphore so total time is roughly (pages / concurrency) * RTT
+instead of pages * RTT. Large pages can be streamed item by item with
+stream_items() rather than materialized whole.
+
+Every request can be paced by a per-source AsyncTokenBucket sized just
+below the API's rate limit, so 429s (still retried with backoff) stay rare.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Protocol, Tuple
+
+import httpx
+import ijson
+
+MAX_CONNECTIONS = 20
+DEFAULT_CONCURRENCY = 10
+DEFAULT_TIMEOUT = 30.0
+STREAM_CHUNK_SIZE = 1 << 16
+
+# ijson prefixes for the item arrays in each source's page envelope
+JIRA_ISSUES_PREFIX = "issues.item"
+BITBUCKET_VALUES_PREFIX = "values.item"
+JENKINS_BUILDS_PREFIX = "builds.item"
+
+# Statuses retried with backoff by get_with_retry()
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# (path, query params) for a single page request
+PageRequest = Tuple[str, Optional[Dict[str, Any]]]
+
+
+class RetryPolicy(Protocol):
+    """Backoff settings; satisfied by the config's common.retry section."""
+
+    max_attempts: int
+    base_delay_seconds: float
+    max_delay_seconds: float
+
+
+class AsyncTokenBucket:
+    """Token bucket allowing `rate` requests per `per` seconds, bursting to `capacity`."""
+
+    def __init__(self, rate: float, per: float = 1.0, capacity: Optional[float] = None):
+        if rate <= 0 or per <= 0:
+            raise ValueError(f"rate and per must be positive, got rate={rate}, per={per}")
+        self.fill_rate = rate / per
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def async_client(base_url: str, auth: Tuple[str, str], **kwargs: Any) -> httpx.AsyncClient:
+    """Build the shared, pooled client for one source."""
+    return httpx.AsyncClient(
+        base_url=base_url,
+        auth=auth,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_CONNECTIONS,
+        ),
+        timeout=DEFAULT_TIMEOUT,
+        **kwargs,
+    )
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds requested by a Retry-After header, if given as a number."""
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _backoff(retry: RetryPolicy, attempt: int) -> float:
+    delay = min(retry.max_delay_seconds, retry.base_delay_seconds * 2 ** attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+
+def _retry_delay(response: httpx.Response, retry: RetryPolicy, attempt: int) -> float:
+    """Retry-After capped at the policy's max delay, else jittered backoff."""
+    delay = _retry_after(response)
+    if delay is None:
+        return _backoff(retry, attempt)
+    return min(delay, retry.max_delay_seconds)
+
+
+async def _send_with_retry(
+    client: httpx.AsyncClient,
+    path: str,
+    params: Optional[Dict[str, Any]],
+    retry: RetryPolicy,
+    limiter: Optional[AsyncTokenBucket],
+    stream: bool = False,
+) -> httpx.Response:
+    for attempt in range(retry.max_attempts):
+        last_attempt = attempt == retry.max_attempts - 1
+        if limiter is not None:
+            await limiter.acquire()
+        try:
+            request = client.build_request("GET", path, params=params)
+            response = await client.send(request, stream=stream)
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+            await asyncio.sleep(_backoff(retry, attempt))
+            continue
+        if response.status_code not in RETRYABLE_STATUS or last_attempt:
+            return response
+        await response.aclose()
+        await asyncio.sleep(_retry_delay(response, retry, attempt))
+
+
+async def get_with_retry(
+    client: httpx.AsyncClient,
+    path: str,
+    params: Optional[Dict[str, Any]],
+    retry: RetryPolicy,
+    limiter: Optional[AsyncTokenBucket] = None,
+) -> httpx.Response:
+    """
+    GET through the limiter, retrying transient failures with jittered backoff.
+
+    Transport errors (connect failures, timeouts, dropped connections) and
+    RETRYABLE_STATUS responses are retried; Retry-After is honoured when
+    the server sends one, up to retry.max_delay_seconds. Once attempts are
+    exhausted the last response is returned, or the last transport error
+    re-raised.
+    """
+    return await _send_with_retry(client, path, params, retry, limiter)
+
+
+async def fetch_page(
+    client: httpx.AsyncClient,
+    request: PageRequest,
+    semaphore: asyncio.Semaphore,
+    retry: RetryPolicy,
+    limiter: Optional[AsyncTokenBucket] = None,
+) -> Any:
+    """Fetch and decode one JSON page, holding a concurrency slot."""
+    path, params = request
+    async with semaphore:
+        response = await get_with_retry(client, path, params, retry, limiter)
+    response.raise_for_status()
+    return response.json()
+
+
+async def fetch_pages(
+    client: httpx.AsyncClient,
+    requests: Iterable[PageRequest],
+    retry: RetryPolicy,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    limiter: Optional[AsyncTokenBucket] = None,
+) -> List[Any]:
+    """
+    Fetch many pages concurrently, in request order.
+
+    Failed pages are returned as exception instances rather than raised,
+    so one bad page does not discard the rest of the batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *(fetch_page(client, request, semaphore, retry, limiter) for request in requests),
+        return_exceptions=True,
+    )
+
+
+async def iter_pages(
+    client: httpx.AsyncClient,
+    requests: Iterable[PageRequest],
+    retry: RetryPolicy,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    limiter: Optional[AsyncTokenBucket] = None,
+) -> AsyncIterator[Any]:
+    """
+    Yield pages as they complete; usable directly as a dlt resource body.
+
+    Errors propagate to the caller on the first failed page.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = [
+        asyncio.ensure_future(fetch_page(client, request, semaphore, retry, limiter))
+        for request in requests
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def stream_items(
+    client: httpx.AsyncClient,
+    path: str,
+    prefix: str,
+    retry: RetryPolicy,
+    params: Optional[Dict[str, Any]] = None,
+    limiter: Optional[AsyncTokenBucket] = None,
+) -> AsyncIterator[Any]:
+    """
+    Stream one page and yield each item under `prefix` as it is parsed.
+
+    The response body is fed to ijson in chunks, so peak memory is one
+    item rather than the whole page, and items can be written to Bronze
+    while the rest of the page is still arriving. Opening the stream is
+    retried like get_with_retry(); once items are yielded a failure
+    propagates, since retrying would repeat them.
+    """
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, prefix, use_float=True)
+    response = await _send_with_retry(client, path, params, retry, limiter, stream=True)
+    try:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            parser.send(chunk)
+            for item in items:
+                yield item
+            del items[:]
+    finally:
+        await response.aclose()
+    parser.close()
+    for item in items:
+        yield item
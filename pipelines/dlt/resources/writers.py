@@ -0,0 +1,320 @@
+"""
+Bronze file writers.
+
+ParquetWriter writes Bronze Parquet for loads done outside dlt (whose
+filesystem destination writes its own Snappy-compressed files): ZSTD-
+compressed, written in row groups, with a JSONL sidecar for rows that do
+not fit the file's schema so no payload field is ever dropped or coerced.
+
+JsonlWriter serializes rows with orjson and appends them through a large
+userspace buffer, so the write path is bounded by disk bandwidth rather
+than by `json.encoder` and per-row flushes. Files are fsynced only when
+they are rotated or closed.
+"""
+
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+JSONL_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_UTC_Z
+
+PARQUET_COMPRESSION = "zstd"
+PARQUET_ROW_GROUP_SIZE = 10_000
+SIDECAR_SUFFIX = ".schema_changed.jsonl"
+
+# Field metadata marking columns stored as JSON text
+JSON_ENCODING_KEY = b"dpl.encoding"
+JSON_ENCODING = b"json"
+
+
+class JsonlWriter:
+    """Buffered, append-only JSONL sink for a single Bronze file at a time."""
+
+    def __init__(self, path: Path, buffer_size: int = WRITE_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self.rows_written = 0
+        self._file = None
+        self._open(path)
+
+    def _open(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._file = open(path, "ab", buffering=self.buffer_size)
+
+    def write(self, row: Any) -> None:
+        """Serialize one row and append it to the buffer."""
+        self._file.write(orjson.dumps(row, option=JSONL_OPTIONS))
+        self.rows_written += 1
+
+    def write_many(self, rows: Iterable[Any]) -> None:
+        """Append a batch of rows."""
+        write = self._file.write
+        count = 0
+        for row in rows:
+            write(orjson.dumps(row, option=JSONL_OPTIONS))
+            count += 1
+        self.rows_written += count
+
+    def _sync_and_close(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+
+    def rotate(self, path: Path) -> Path:
+        """Durably finish the current file and continue writing to `path`."""
+        finished = self.path
+        self._sync_and_close()
+        self._open(path)
+        return finished
+
+    def close(self) -> Optional[Path]:
+        """Flush, fsync and close the current file."""
+        if self._file is None:
+            return None
+        self._sync_and_close()
+        return self.path
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _is_json_field(field: pa.Field) -> bool:
+    return bool(field.metadata) and field.metadata.get(JSON_ENCODING_KEY) == JSON_ENCODING
+
+
+def _is_list(arrow_type: pa.DataType) -> bool:
+    return pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type)
+
+
+def _normalize_field(field: pa.Field) -> pa.Field:
+    """
+    Replace types that cannot describe later values with JSON text.
+
+    An all-null column infers as `null`, an empty object as `struct<>` (which
+    Parquet cannot store) and an empty array as `list<null>`. Rather than
+    sidecar every later row with a real value, such fields are stored as
+    JSON-encoded strings and flagged in the field metadata.
+    """
+    arrow_type = field.type
+    json_field = pa.field(field.name, pa.large_string(), metadata={JSON_ENCODING_KEY: JSON_ENCODING})
+    if pa.types.is_null(arrow_type):
+        return json_field
+    if pa.types.is_struct(arrow_type):
+        if arrow_type.num_fields == 0:
+            return json_field
+        return field.with_type(pa.struct([_normalize_field(child) for child in arrow_type]))
+    if _is_list(arrow_type):
+        value_field = _normalize_field(arrow_type.value_field)
+        if _is_json_field(value_field):
+            return json_field
+        return field.with_type(pa.list_(value_field))
+    return field
+
+
+def _normalize_schema(schema: pa.Schema) -> pa.Schema:
+    return pa.schema([_normalize_field(field) for field in schema], metadata=schema.metadata)
+
+
+def _fits_scalar(value: Any, arrow_type: pa.DataType) -> bool:
+    """Whether a scalar converts to arrow_type without truncation or coercion."""
+    if pa.types.is_boolean(arrow_type):
+        return isinstance(value, bool)
+    if isinstance(value, bool):
+        return False
+    if pa.types.is_integer(arrow_type):
+        if not isinstance(value, int):
+            return False
+        bits = arrow_type.bit_width
+        if pa.types.is_signed_integer(arrow_type):
+            return -(1 << (bits - 1)) <= value < (1 << (bits - 1))
+        return 0 <= value < (1 << bits)
+    if pa.types.is_float64(arrow_type):
+        # Larger ints would silently lose precision as doubles
+        return isinstance(value, float) or (isinstance(value, int) and abs(value) <= 1 << 53)
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return isinstance(value, str)
+    if pa.types.is_binary(arrow_type) or pa.types.is_large_binary(arrow_type):
+        return isinstance(value, bytes)
+    if pa.types.is_timestamp(arrow_type):
+        return isinstance(value, datetime) and (value.tzinfo is None) == (arrow_type.tz is None)
+    if pa.types.is_date(arrow_type):
+        return isinstance(value, date) and not isinstance(value, datetime)
+    if pa.types.is_decimal(arrow_type):
+        return isinstance(value, Decimal)
+    # Anything else (e.g. from a schema hint) is not checked, so reject it
+    return False
+
+
+def _fits_field(value: Any, field: pa.Field) -> bool:
+    """
+    Whether a value converts to the field's type without losing data.
+
+    pyarrow silently drops dict keys missing from a struct type and
+    truncates floats written into integer columns, so structs and lists
+    are checked recursively and scalars must match their type exactly.
+    """
+    if value is None or _is_json_field(field):
+        return True
+    arrow_type = field.type
+    if pa.types.is_struct(arrow_type):
+        if not isinstance(value, dict):
+            return False
+        children = {child.name: child for child in arrow_type}
+        return all(key in children and _fits_field(item, children[key]) for key, item in value.items())
+    if _is_list(arrow_type):
+        if not isinstance(value, list):
+            return False
+        return all(_fits_field(item, arrow_type.value_field) for item in value)
+    return _fits_scalar(value, arrow_type)
+
+
+def _encode_field(value: Any, field: pa.Field) -> Any:
+    """Prepare a fitting value for conversion, JSON-encoding flagged fields."""
+    if value is None:
+        return None
+    if _is_json_field(field):
+        return orjson.dumps(value, option=orjson.OPT_UTC_Z).decode()
+    arrow_type = field.type
+    if pa.types.is_struct(arrow_type):
+        children = {child.name: child for child in arrow_type}
+        return {key: _encode_field(item, children[key]) for key, item in value.items()}
+    if _is_list(arrow_type):
+        return [_encode_field(item, arrow_type.value_field) for item in value]
+    return value
+
+
+class ParquetWriter:
+    """
+    Row-group-buffered Parquet sink for a single Bronze file.
+
+    The file schema is taken from `schema` or inferred from the first row
+    group; fields whose type cannot be inferred are stored as JSON text
+    (see _normalize_field). Rows that later fail to fit the schema are
+    appended to a JSONL sidecar next to the file instead of being dropped
+    or coerced.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        schema: Optional[pa.Schema] = None,
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+        compression: str = PARQUET_COMPRESSION,
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.sidecar_path = path.with_suffix(SIDECAR_SUFFIX)
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.rows_written = 0
+        self.rows_sidecar = 0
+        self._rows: List[Dict[str, Any]] = []
+        self._fields: Dict[str, pa.Field] = {}
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._sidecar: Optional[JsonlWriter] = None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Buffer one row, flushing a row group when the buffer is full."""
+        self._rows.append(row)
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+
+    def write_many(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Buffer a batch of rows."""
+        for row in rows:
+            self.write(row)
+
+    def _fits(self, row: Dict[str, Any]) -> bool:
+        return all(
+            key in self._fields and _fits_field(value, self._fields[key])
+            for key, value in row.items()
+        )
+
+    def _encode(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: _encode_field(value, self._fields[key]) for key, value in row.items()}
+
+    def _to_sidecar(self, rows: List[Dict[str, Any]]) -> None:
+        if self._sidecar is None:
+            self._sidecar = JsonlWriter(self.sidecar_path)
+        self._sidecar.write_many(rows)
+        self.rows_sidecar += len(rows)
+
+    @staticmethod
+    def _infer_schema(rows: List[Dict[str, Any]]) -> pa.Schema:
+        # from_pylist takes column names from the first row only, so pad
+        # every row to the union of keys seen across the row group
+        keys = list(dict.fromkeys(key for row in rows for key in row))
+        try:
+            return pa.Table.from_pylist([{key: row.get(key) for key in keys} for row in rows]).schema
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            # Conflicting types within the batch; each column's first value decides
+            columns = []
+            for key in keys:
+                first = next((row[key] for row in rows if row.get(key) is not None), None)
+                columns.append(pa.field(key, pa.array([first]).type))
+            return pa.schema(columns)
+
+    def _open(self, schema: pa.Schema) -> None:
+        self.schema = _normalize_schema(schema)
+        self._fields = {field.name: field for field in self.schema}
+        self._writer = pq.ParquetWriter(self.path, self.schema, compression=self.compression)
+
+    def flush(self) -> None:
+        """Write buffered rows as one row group."""
+        rows, self._rows = self._rows, []
+        if not rows:
+            return
+        if self._writer is None:
+            self._open(self.schema or self._infer_schema(rows))
+        
+        fitting, rejected = [], []
+        for row in rows:
+            (fitting if self._fits(row) else rejected).append(row)
+        encoded = [self._encode(row) for row in fitting]
+        try:
+            table = pa.Table.from_pylist(encoded, schema=self.schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            # Fall back to per-row conversion to isolate the offending rows
+            tables = []
+            for row, encoded_row in zip(fitting, encoded):
+                try:
+                    tables.append(pa.Table.from_pylist([encoded_row], schema=self.schema))
+                except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                    rejected.append(row)
+            table = pa.concat_tables(tables) if tables else None
+        
+        if table is not None and table.num_rows:
+            self._writer.write_table(table)
+            self.rows_written += table.num_rows
+        if rejected:
+            self._to_sidecar(rejected)
+
+    def close(self) -> Optional[Path]:
+        """Flush remaining rows and close the file and any sidecar."""
+        self.flush()
+        if self._sidecar is not None:
+            self._sidecar.close()
+            self._sidecar = None
+        if self._writer is None:
+            return None
+        self._writer.close()
+        self._writer = None
+        return self.path
+
+    def __enter__(self) -> "ParquetWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,156 @@
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pipelines.dlt import pipelines as dpl
+
+REPO_CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+
+@pytest.fixture
+def config_env(tmp_path, monkeypatch):
+    """Point the loader at a private copy of the config and a fresh cache dir."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    for name in dpl.CONFIG_FILES:
+        shutil.copy(REPO_CONFIG_DIR / name, config_dir / name)
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(dpl, "CONFIG_DIR", config_dir)
+    monkeypatch.setattr(dpl, "CONFIG_CACHE_DIR", cache_dir)
+    dpl._load_config_cached.cache_clear()
+    dpl._get_config_cached.cache_clear()
+    yield config_dir, cache_dir
+    dpl._load_config_cached.cache_clear()
+    dpl._get_config_cached.cache_clear()
+
+
+def _snapshots(cache_dir):
+    return sorted(cache_dir.glob("config-*.bin"))
+
+
+def test_snapshot_is_private_and_reused(config_env, monkeypatch):
+    _, cache_dir = config_env
+    config = dpl.load_config()
+    
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    [snapshot] = _snapshots(cache_dir)
+    assert snapshot.stat().st_mode & 0o777 == 0o600
+    
+    # A fresh process must read the snapshot instead of parsing YAML
+    dpl._load_config_cached.cache_clear()
+    monkeypatch.setattr(dpl.yaml, "load", lambda *a, **k: pytest.fail("YAML re-parsed"))
+    assert dpl.load_config() == config
+
+
+def test_repeated_calls_return_same_object_until_edit(config_env):
+    config_dir, _ = config_env
+    first = dpl.load_config()
+    assert dpl.load_config() is first
+    
+    time_file = config_dir / "time.yaml"
+    time_file.write_text(time_file.read_text().replace("Europe/Berlin", "UTC"))
+    assert dpl.load_config()["time"]["timezone"] == "UTC"
+    assert dpl.get_config().time.timezone == "UTC"
+
+
+def test_stale_snapshots_are_pruned(config_env):
+    config_dir, cache_dir = config_env
+    dpl.load_config()
+    [old] = _snapshots(cache_dir)
+    
+    time_file = config_dir / "time.yaml"
+    time_file.write_text(time_file.read_text() + "\n# edited\n")
+    dpl.load_config()
+    
+    [new] = _snapshots(cache_dir)
+    assert new != old
+
+
+def test_other_checkouts_snapshots_are_kept(config_env):
+    config_dir, cache_dir = config_env
+    dpl.load_config()
+    other = cache_dir / "config-000000000000-0123.bin"
+    other.write_bytes(b"")
+    
+    time_file = config_dir / "time.yaml"
+    time_file.write_text(time_file.read_text() + "\n# edited\n")
+    dpl.load_config()
+    
+    assert other.exists()
+    assert len(_snapshots(cache_dir)) == 2
+
+
+def test_failed_snapshot_write_leaves_no_temp_file(config_env, monkeypatch):
+    _, cache_dir = config_env
+    
+    def disk_full(*args, **kwargs):
+        raise OSError(28, "No space left on device")
+    
+    monkeypatch.setattr(dpl.pickle, "dump", disk_full)
+    assert dpl.load_config()["time"]["timezone"] == "Europe/Berlin"
+    assert list(cache_dir.iterdir()) == []
+
+
+class _Exploit:
+    """Pickle payload that creates a marker file when loaded."""
+
+    def __init__(self, marker):
+        self.marker = str(marker)
+
+    def __reduce__(self):
+        return (open, (self.marker, "w"))
+
+
+@pytest.mark.parametrize("mode", [0o666, 0o620, 0o604])
+def test_non_private_snapshot_is_not_unpickled(config_env, tmp_path, mode):
+    _, cache_dir = config_env
+    marker = tmp_path / "pwned"
+    cache_dir.mkdir(mode=0o700)
+    planted = cache_dir / f"{dpl._config_cache_prefix()}{dpl._config_cache_key(dpl._config_stamp())}.bin"
+    planted.write_bytes(pickle.dumps(_Exploit(marker)))
+    planted.chmod(mode)
+    
+    config = dpl.load_config()
+    
+    assert not marker.exists()
+    assert config["time"]["timezone"] == "Europe/Berlin"
+
+
+def test_loose_cache_dir_is_tightened(config_env):
+    _, cache_dir = config_env
+    cache_dir.mkdir(mode=0o777)
+    cache_dir.chmod(0o777)
+    dpl.load_config()
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+
+def test_symlinked_cache_dir_is_not_used(config_env, tmp_path):
+    _, cache_dir = config_env
+    target = tmp_path / "elsewhere"
+    target.mkdir(mode=0o700)
+    cache_dir.symlink_to(target)
+    
+    assert dpl.load_config()["time"]["timezone"] == "Europe/Berlin"
+    assert not list(target.iterdir())
+
+
+@pytest.mark.parametrize("rate", [0, -1])
+def test_non_positive_rate_limit_is_rejected(config_env, rate):
+    config_dir, _ = config_env
+    sources = config_dir / "sources.yaml"
+    sources.write_text(sources.read_text().replace(
+        "rate_limit_per_second: 10 ", f"rate_limit_per_second: {rate} "
+    ))
+    with pytest.raises(ValueError, match=r"config\.sources\.jira\.rate_limit_per_second: must be > 0"):
+        dpl.get_config()
+
+
+def test_wildcard_repos_are_accepted(config_env):
+    config_dir, _ = config_env
+    sources = config_dir / "sources.yaml"
+    sources.write_text(sources.read_text().replace(
+        'repos: ["platform", "core", "mobile"]', 'repos: "*"'
+    ))
+    assert dpl.get_config().sources.bitbucket.repos == ("*",)
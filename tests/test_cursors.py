@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pipelines.dlt.resources.cursors import (
+    Cursor,
+    backfill_cursor,
+    bitbucket_cursor_params,
+    jira_cursor_params,
+)
+
+UTC = timezone.utc
+TS = datetime(2026, 1, 10, 12, 30, 45, tzinfo=UTC)
+
+
+def test_manifest_round_trip():
+    cursor = Cursor(last_id="KAP-1", last_updated=TS)
+    assert Cursor.from_manifest(cursor.to_manifest()) == cursor
+    assert Cursor.from_manifest(None) == Cursor()
+
+
+def test_naive_timestamps_are_treated_as_utc():
+    cursor = backfill_cursor(3, now=TS)
+    advanced = cursor.advance("KAP-1", TS.replace(tzinfo=None))
+    assert advanced.last_updated == TS
+    
+    legacy = {"cursor": {"last_id": "1", "last_updated": "2026-01-10T12:30:45"}}
+    assert Cursor.from_manifest(legacy).last_updated == TS
+
+
+def test_is_after_drops_only_the_landed_record():
+    cursor = Cursor(last_id="KAP-2", last_updated=TS)
+    assert not cursor.is_after("KAP-1", TS - timedelta(seconds=1))
+    assert not cursor.is_after("KAP-2", TS)
+    # Same timestamp, different record: must not be skipped
+    assert cursor.is_after("KAP-3", TS)
+    assert cursor.is_after("KAP-1", TS)
+    assert cursor.is_after("KAP-1", TS + timedelta(seconds=1))
+    assert Cursor().is_after("KAP-1", TS)
+
+
+def test_advance_never_moves_backwards():
+    cursor = Cursor(last_id="2", last_updated=TS)
+    assert cursor.advance("1", TS - timedelta(hours=1)) is cursor
+    assert cursor.advance("3", TS).last_id == "3"
+
+
+def test_jira_params_use_profile_timezone_and_inclusive_bound():
+    cursor = Cursor(last_id="KAP-1", last_updated=TS)
+    params = jira_cursor_params(
+        cursor, "project in (KAP) ORDER BY updated DESC", tz="America/New_York",
+        next_page_token="tok",
+    )
+    assert params["jql"] == (
+        '(project in (KAP)) AND updated >= "2026/01/10 07:30" ORDER BY updated ASC'
+    )
+    assert params["nextPageToken"] == "tok"
+    assert params["maxResults"] == 100
+    assert params["fields"] == "summary,updated"
+
+
+@pytest.mark.parametrize("base_jql", ["", "   ", "ORDER BY updated DESC"])
+def test_jira_params_without_base_jql(base_jql):
+    params = jira_cursor_params(Cursor(last_updated=TS), base_jql, tz="UTC")
+    assert params["jql"] == 'updated >= "2026/01/10 12:30" ORDER BY updated ASC'
+    assert jira_cursor_params(Cursor(), base_jql, tz="UTC")["jql"] == "ORDER BY updated ASC"
+
+
+def test_bitbucket_params_use_inclusive_bound():
+    params = bitbucket_cursor_params(Cursor(last_updated=TS), fields=["values.id"], page="p2")
+    assert params == {
+        "fields": "values.id,values.updated_on,next",
+        "pagelen": 50,
+        "sort": "updated_on",
+        "q": "updated_on >= 2026-01-10T12:30:45+00:00",
+        "page": "p2",
+    }
+
+
+def test_cursor_fields_are_not_duplicated():
+    params = jira_cursor_params(Cursor(), "", tz="UTC", fields=["updated", "summary"])
+    assert params["fields"] == "updated,summary"
+    params = bitbucket_cursor_params(Cursor(), fields=["next", "values.updated_on"])
+    assert params["fields"] == "next,values.updated_on"
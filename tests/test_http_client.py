@@ -0,0 +1,137 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pipelines.dlt import pipelines as dpl
+from pipelines.dlt.resources import http_client
+from pipelines.dlt.resources.http_client import (
+    AsyncTokenBucket,
+    fetch_pages,
+    get_with_retry,
+    stream_items,
+)
+
+RETRY = dpl.RetryConfig(max_attempts=3, base_delay_seconds=2.0, max_delay_seconds=60.0)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Record backoff delays instead of waiting them out."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(http_client.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _client(responses):
+    """Client whose transport replays `responses` (exceptions are raised)."""
+    calls = iter(responses)
+
+    def handler(request):
+        outcome = next(calls)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return httpx.AsyncClient(base_url="http://api", transport=httpx.MockTransport(handler))
+
+
+def _get(client, retry=RETRY):
+    async def run():
+        async with client:
+            return await get_with_retry(client, "/page", None, retry)
+    return asyncio.run(run())
+
+
+def test_transport_errors_are_retried(no_sleep):
+    client = _client([
+        httpx.ConnectError("refused"),
+        httpx.ReadTimeout("slow"),
+        httpx.Response(200, json={"ok": True}),
+    ])
+    assert _get(client).json() == {"ok": True}
+    assert len(no_sleep) == 2
+
+
+def test_transport_error_reraised_after_last_attempt():
+    client = _client([httpx.ConnectError("refused")] * 3)
+    with pytest.raises(httpx.ConnectError):
+        _get(client)
+
+
+def test_retry_after_is_honoured(no_sleep):
+    client = _client([
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(200),
+    ])
+    assert _get(client).status_code == 200
+    assert no_sleep == [7.0]
+
+
+def test_retry_after_is_capped(no_sleep):
+    client = _client([
+        httpx.Response(503, headers={"Retry-After": "3600"}),
+        httpx.Response(200),
+    ])
+    assert _get(client).status_code == 200
+    assert no_sleep == [RETRY.max_delay_seconds]
+
+
+def test_backoff_uses_configured_cap(no_sleep):
+    retry = dpl.RetryConfig(max_attempts=4, base_delay_seconds=10.0, max_delay_seconds=15.0)
+    client = _client([httpx.Response(503)] * 4)
+    assert _get(client, retry).status_code == 503
+    assert len(no_sleep) == 3
+    assert all(delay <= 15.0 * 1.5 for delay in no_sleep)
+
+
+def test_client_errors_are_not_retried(no_sleep):
+    client = _client([httpx.Response(404)])
+    assert _get(client).status_code == 404
+    assert no_sleep == []
+
+
+def test_fetch_pages_returns_failures_in_place():
+    client = _client([httpx.Response(200, json={"p": 1}), httpx.Response(404)])
+
+    async def run():
+        async with client:
+            return await fetch_pages(client, [("/a", None), ("/b", None)], RETRY, concurrency=1)
+
+    first, second = asyncio.run(run())
+    assert first == {"p": 1}
+    assert isinstance(second, httpx.HTTPStatusError)
+
+
+@pytest.mark.parametrize("rate, per", [(0, 1.0), (-1, 1.0), (5, 0)])
+def test_token_bucket_rejects_non_positive_rates(rate, per):
+    with pytest.raises(ValueError):
+        AsyncTokenBucket(rate, per)
+
+
+def _stream(client, prefix="values.item"):
+    async def run():
+        async with client:
+            return [item async for item in stream_items(client, "/page", prefix, RETRY)]
+    return asyncio.run(run())
+
+
+def test_stream_items_retries_before_first_item(no_sleep):
+    client = _client([
+        httpx.ConnectError("refused"),
+        httpx.Response(429, headers={"Retry-After": "1"}),
+        httpx.Response(200, json={"values": [{"id": 1}, {"id": 2}]}),
+    ])
+    assert _stream(client) == [{"id": 1}, {"id": 2}]
+    assert len(no_sleep) == 2
+
+
+def test_stream_items_raises_after_last_attempt(no_sleep):
+    client = _client([httpx.Response(503)] * RETRY.max_attempts)
+    with pytest.raises(httpx.HTTPStatusError):
+        _stream(client)
+    assert len(no_sleep) == RETRY.max_attempts - 1
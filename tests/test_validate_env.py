@@ -0,0 +1,134 @@
+import errno
+import os
+
+import pytest
+import requests
+
+from scripts import validate_env
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Record backoff delays instead of waiting them out."""
+    delays = []
+    monkeypatch.setattr(validate_env.time, "sleep", delays.append)
+    return delays
+
+
+def _response(status):
+    response = requests.Response()
+    response.status_code = status
+    return response
+
+
+@pytest.fixture
+def session_get(monkeypatch):
+    """Replay `outcomes` from _SESSION.get (exceptions are raised)."""
+    calls = []
+
+    def install(outcomes):
+        outcomes = iter(outcomes)
+
+        def fake_get(*args, **kwargs):
+            calls.append((args, kwargs))
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(validate_env._SESSION, "get", fake_get)
+        return calls
+
+    return install
+
+
+def _get():
+    return validate_env._retry(lambda: validate_env._SESSION.get("https://api"))
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_retryable_statuses_are_retried(session_get, no_sleep, status):
+    calls = session_get([_response(status), _response(200)])
+    assert _get().status_code == 200
+    assert len(calls) == 2
+    assert len(no_sleep) == 1
+
+
+@pytest.mark.parametrize("status", [401, 403, 404])
+def test_other_client_errors_fail_fast(session_get, no_sleep, status):
+    calls = session_get([_response(status)])
+    assert _get().status_code == status
+    assert len(calls) == 1
+    assert no_sleep == []
+
+
+def test_last_retryable_response_is_returned(session_get, no_sleep):
+    session_get([_response(503)] * 3)
+    assert _get().status_code == 503
+    assert len(no_sleep) == 2
+
+
+def test_connection_errors_are_retried_then_reraised(session_get, no_sleep):
+    calls = session_get([
+        requests.exceptions.ConnectionError("reset"),
+        requests.exceptions.Timeout("slow"),
+        requests.exceptions.ConnectionError("reset"),
+    ])
+    with pytest.raises(requests.exceptions.ConnectionError):
+        _get()
+    assert len(calls) == 3
+    assert len(no_sleep) == 2
+
+
+def test_backoff_is_capped_with_jitter(session_get, no_sleep):
+    session_get([_response(503)] * 5)
+    validate_env._retry(lambda: validate_env._SESSION.get("https://api"), max_attempts=5, base=10, cap=15)
+    assert len(no_sleep) == 4
+    assert all(5 <= delay <= 15 * 1.5 for delay in no_sleep)
+
+
+def test_probe_reports_http_status(session_get):
+    env = dict.fromkeys(validate_env.REQUIRED_VARS, "x")
+    session_get([_response(401)])
+    assert validate_env._probe_jira(env) == ("Jira API", False, "✗ HTTP 401")
+
+
+@pytest.fixture
+def no_tmpfile(monkeypatch):
+    """Make O_TMPFILE opens fail with `code` and record fallback writes."""
+    if not hasattr(os, "O_TMPFILE"):
+        pytest.skip("O_TMPFILE is Linux-only")
+    written = []
+    real_open = os.open
+    real_write_text = validate_env.Path.write_text
+
+    def install(code):
+        def fake_open(path, flags, *args, **kwargs):
+            if flags & os.O_TMPFILE == os.O_TMPFILE:
+                raise OSError(code, os.strerror(code))
+            return real_open(path, flags, *args, **kwargs)
+
+        def spy_write_text(self, *args, **kwargs):
+            written.append(self.name)
+            return real_write_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(validate_env.os, "open", fake_open)
+        monkeypatch.setattr(validate_env.Path, "write_text", spy_write_text)
+        return written
+
+    return install
+
+
+@pytest.mark.parametrize("code", [errno.EOPNOTSUPP, errno.EISDIR])
+def test_probe_write_falls_back_without_tmpfile(tmp_path, no_tmpfile, code):
+    written = no_tmpfile(code)
+    validate_env._probe_write(tmp_path)
+    assert written == [".test_write"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_probe_write_raises_other_errors(tmp_path, no_tmpfile):
+    written = no_tmpfile(errno.EACCES)
+    with pytest.raises(PermissionError):
+        validate_env._probe_write(tmp_path)
+    assert written == []
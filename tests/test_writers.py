@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from pipelines.dlt.resources.writers import JsonlWriter, ParquetWriter
+
+
+def _write(tmp_path, *row_groups, schema=None):
+    """Write each list of rows as its own row group; return (rows, sidecar rows, writer)."""
+    path = tmp_path / "out.parquet"
+    with ParquetWriter(path, schema=schema) as writer:
+        for rows in row_groups:
+            writer.write_many(rows)
+            writer.flush()
+    written = pq.read_table(path).to_pylist() if path.exists() else []
+    sidecar = []
+    if writer.sidecar_path.exists():
+        sidecar = [orjson.loads(line) for line in writer.sidecar_path.read_bytes().splitlines()]
+    return written, sidecar, writer
+
+
+def test_jsonl_writer_appends_and_rotates(tmp_path):
+    first, second = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+    with JsonlWriter(first) as writer:
+        writer.write({"t": datetime(2026, 1, 1, tzinfo=timezone.utc)})
+        writer.write_many([{"n": 1}, {"n": 2}])
+        assert writer.rotate(second) == first
+        writer.write({"n": 3})
+    assert first.read_bytes() == b'{"t":"2026-01-01T00:00:00Z"}\n{"n":1}\n{"n":2}\n'
+    assert second.read_bytes() == b'{"n":3}\n'
+    assert writer.rows_written == 4
+
+
+def test_rows_fitting_schema_round_trip(tmp_path):
+    rows = [{"id": i, "f": {"a": float(i), "tags": ["x"]}} for i in range(5)]
+    written, sidecar, _ = _write(tmp_path, rows)
+    assert written == rows
+    assert sidecar == []
+
+
+@pytest.mark.parametrize("value", [1.5, True, "2", [1]])
+def test_mismatched_scalars_go_to_sidecar(tmp_path, value):
+    first = [{"id": 1, "f": {"a": 1}}]
+    later = [{"id": 2, "f": {"a": value}}]
+    written, sidecar, _ = _write(tmp_path, first, later)
+    assert written == first
+    assert sidecar == later
+
+
+def test_unknown_keys_go_to_sidecar(tmp_path):
+    written, sidecar, _ = _write(
+        tmp_path,
+        [{"id": 1, "f": {"a": 1}}],
+        [{"id": 2, "f": {"a": 2, "b": 3}}, {"id": 3, "g": 1}],
+    )
+    assert written == [{"id": 1, "f": {"a": 1}}]
+    assert sidecar == [{"id": 2, "f": {"a": 2, "b": 3}}, {"id": 3, "g": 1}]
+
+
+def test_empty_struct_is_stored_as_json(tmp_path):
+    written, sidecar, writer = _write(
+        tmp_path,
+        [{"id": 1, "x": {}}],
+        [{"id": 2, "x": {"k": 1}}],
+    )
+    assert sidecar == []
+    assert [orjson.loads(row["x"]) for row in written] == [{}, {"k": 1}]
+    assert writer.schema.field("x").type == pa.large_string()
+
+
+def test_all_null_column_accepts_later_values(tmp_path):
+    rows = [{"id": i, "resolved": None} for i in range(3)]
+    later = [{"id": 3, "resolved": "2024-01-01"}, {"id": 4, "resolved": {"name": "Done"}}]
+    written, sidecar, _ = _write(tmp_path, rows, later)
+    assert sidecar == []
+    assert [row["resolved"] for row in written] == [None, None, None, '"2024-01-01"', '{"name":"Done"}']
+
+
+def test_nested_null_and_empty_list_are_stored_as_json(tmp_path):
+    first = [{"fields": {"resolution": None, "components": [], "summary": "a"}}]
+    later = [{"fields": {"resolution": {"id": "1"}, "components": [{"id": "2"}], "summary": "b"}}]
+    written, sidecar, _ = _write(tmp_path, first, later)
+    assert sidecar == []
+    assert written[1]["fields"] == {
+        "resolution": '{"id":"1"}',
+        "components": '[{"id":"2"}]',
+        "summary": "b",
+    }
+
+
+def test_conflicting_first_row_group_is_split(tmp_path):
+    written, sidecar, _ = _write(tmp_path, [{"id": 1}, {"id": "two"}])
+    assert written == [{"id": 1}]
+    assert sidecar == [{"id": "two"}]
+
+
+def test_keys_missing_from_first_row_are_in_schema(tmp_path):
+    written, sidecar, writer = _write(tmp_path, [{"id": 1}, {"id": 2, "x": 5}, {"id": 3, "x": 6}])
+    assert written == [{"id": 1, "x": None}, {"id": 2, "x": 5}, {"id": 3, "x": 6}]
+    assert sidecar == []
+    assert writer.rows_written == 3
+
+
+def test_schema_hint_is_enforced(tmp_path):
+    schema = pa.schema([("id", pa.int32()), ("name", pa.string())])
+    written, sidecar, _ = _write(
+        tmp_path, [{"id": 1, "name": "a"}, {"id": 1 << 40, "name": "b"}], schema=schema
+    )
+    assert written == [{"id": 1, "name": "a"}]
+    assert sidecar == [{"id": 1 << 40, "name": "b"}]
+
+
+def test_file_is_zstd_compressed(tmp_path):
+    _, _, writer = _write(tmp_path, [{"id": 1}])
+    metadata = pq.ParquetFile(writer.path).metadata
+    assert metadata.row_group(0).column(0).compression == "ZSTD"